@@ -1,11 +1,18 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -I -S
 """
 EVM Block Number Filter
 
 This script filters monitor matches based on the block number of the transaction.
 It demonstrates a simple filter that only allows transactions from even-numbered blocks.
 
-Input: JSON object containing:
+By default the script runs as a persistent worker: it reads newline-delimited
+JSON payloads from stdin and emits one verdict per line, so a single
+interpreter can serve many matches. Pass --oneshot to read a single payload
+and exit, matching the spawn-per-match calling convention. Pass
+--input-file PATH to memory-map a payload from disk instead of reading
+stdin.
+
+Input: JSON object (one per line) containing:
     - monitor_match: The monitor match data with transaction details
     - args: Additional arguments passed to the script
 
@@ -13,50 +20,136 @@ Output:
     - Prints 'true' for transactions in even-numbered blocks
     - Prints 'false' for transactions in odd-numbered blocks or invalid input
 
-Note: Block numbers are extracted from the EVM transaction data and converted
-from hexadecimal to decimal before processing.
+Note: Block numbers are extracted from the EVM transaction data as hex
+strings; parity is decided from the last hex digit without a full
+integer conversion.
 """
+import mmap
+import os
+import re
 import sys
-import json
+from operator import itemgetter
+try:
+    import orjson as json
+except ImportError:
+    import json
 
-def main():
+CHAIN = "EVM"
+loads = json.loads
+_OUT = (b'false\n', b'true\n')
+# Bound getter for the chain key; the remaining keys are interned literals,
+# so repeated dict probes on the fallback path hit the identity fast path
+_get_chain = itemgetter(CHAIN)
+
+# Descriptive output costs two formatted prints per match; keep it off the
+# hot path unless explicitly requested
+DEBUG = bool(os.environ.get("FILTER_DEBUG"))
+
+# Fast path: pull blockNumber straight out of the raw bytes so the common
+# case never builds the JSON tree
+BLOCK_RE = re.compile(rb'"blockNumber"\s*:\s*"0x([0-9a-fA-F]+)"')
+
+def _excepthook(exc_type, exc, tb):
+    # Surface unexpected errors on stderr and exit non-zero so the monitor
+    # logs a script failure instead of parsing a stale verdict
+    sys.stderr.write(f"Error: {exc}\n")
+    sys.exit(2)
+
+sys.excepthook = _excepthook
+
+def _emit(result, message=b''):
+    # One buffered write carries any diagnostics plus the verdict line
+    sys.stdout.buffer.write(message + _OUT[bool(result)])
+    sys.stdout.buffer.flush()
+
+def process(input_data):
+    # Fast path: regex extraction of the only field we read
+    m = BLOCK_RE.search(input_data)
+    if m:
+        hex_digits = m.group(1)
+        result = hex_digits[-1] in b'02468aceACE'
+        if DEBUG:
+            return result, f"Block number 0x{hex_digits.decode()} is {'even' if result else 'odd'}\n".encode()
+        return result, b''
+
+    # Slow path: full JSON parse, covering invalid input and payloads
+    # where the field is absent
+    if not isinstance(input_data, (bytes, bytearray)):
+        # mmap'd input: the parser needs a real bytes object
+        input_data = bytes(input_data)
     try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
+        data = loads(input_data)
+        monitor_match = data['monitor_match']
+        args = data['args']
+    except json.JSONDecodeError as e:
+        return False, f"Invalid JSON input: {e}\n".encode()
+
+    # Extract block_number
+    tx = _get_chain(monitor_match).get('transaction') if CHAIN in monitor_match else None
+    hex_block = tx.get('blockNumber') if tx else None
+
+    if not hex_block:
+        return False, b'Block number is None\n'
+
+    # Parity only depends on the last hex digit, so check it directly
+    # instead of converting the whole hex string to an integer
+    hex_digits = hex_block[2:] if hex_block.startswith('0x') else hex_block
+    result = hex_digits[-1] in '02468aceACE'
+    if DEBUG:
+        return result, f"Block number 0x{hex_digits} is {'even' if result else 'odd'}\n".encode()
+    return result, b''
+
+def main():
+    argv = sys.argv[1:]
+    if "--input-file" in argv:
+        # Memory-map a payload the caller materialized on disk, handing the
+        # parser a zero-copy view instead of reading the pipe into a buffer
+        path = argv[argv.index("--input-file") + 1]
+        with open(path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                _emit(False, b'No input JSON provided\n')
+                return
+            with mm:
+                _emit(*process(mm))
+        return
+
+    if "--exit-code" in argv:
+        # Report the verdict through the exit status (0 even, 1 odd or
+        # invalid) instead of stdout, for callers that check return codes.
+        # Implies one-shot, since a process has a single exit code.
+        input_data = sys.stdin.buffer.read()
         if not input_data:
-            print("No input JSON provided", flush=True)
-            return False
-
-        # Parse input JSON
-        try:
-            data = json.loads(input_data)
-            monitor_match = data['monitor_match']
-            args = data['args']
-        except json.JSONDecodeError as e:
-            print(f"Invalid JSON input: {e}", flush=True)
-            return False
-
-        # Extract block_number
-        block_number = None
-        if "EVM" in monitor_match:
-            hex_block = monitor_match['EVM']['transaction'].get('blockNumber')
-            if hex_block:
-                # Convert hex string to integer
-                block_number = int(hex_block, 16)
-
-        if block_number is None:
-            print("Block number is None")
-            return False
-
-        result = block_number % 2 == 0
-        print(f"Block number {block_number} is {'even' if result else 'odd'}", flush=True)
-        return result
-
-    except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
-        return False
+            result, message = False, b'No input JSON provided\n'
+        else:
+            result, message = process(input_data)
+        if message:
+            sys.stderr.buffer.write(message)
+        sys.exit(0 if result else 1)
+
+    if "--oneshot" in argv:
+        # Read a single payload from stdin and emit one verdict
+        input_data = sys.stdin.buffer.read()
+        if not input_data:
+            _emit(False, b'No input JSON provided\n')
+            return
+        _emit(*process(input_data))
+        return
+
+    # Worker mode: one newline-delimited JSON payload per line, one
+    # verdict per line. A single-line payload behaves exactly like the
+    # one-shot mode, so spawn-per-match callers need no changes.
+    seen_input = False
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        seen_input = True
+        _emit(*process(line))
+
+    if not seen_input:
+        _emit(False, b'No input JSON provided\n')
 
 if __name__ == "__main__":
-    result = main()
-    # Print the final boolean result
-    print(str(result).lower(), flush=True)
+    main()
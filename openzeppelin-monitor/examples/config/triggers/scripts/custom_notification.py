@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -I -S
 """
 Custom Notification Script
 This script validates monitor match data and logs validation results to stderr.
@@ -10,28 +10,34 @@ Input: JSON object containing:
 Note: Only stderr output is monitored. If the script returns a non-zero exit code, the error will be logged.
 """
 import sys
-import json
+try:
+    import orjson as json
+except ImportError:
+    import json
 
-def main():
-    try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
-        if not input_data:
-            print("No input JSON provided", flush=True)
+def _excepthook(exc_type, exc, tb):
+    # Surface unexpected errors on stderr and exit non-zero so the monitor
+    # logs a script failure instead of parsing a stale verdict
+    sys.stderr.write(f"Error: {exc}\n")
+    sys.exit(2)
 
-        # Parse input JSON
-        try:
-            data = json.loads(input_data)
-            monitor_match = data['monitor_match']
-            args = data['args']
-            if args:
-                print(f"Args: {args}")
-        except json.JSONDecodeError as e:
-            print(f"Invalid JSON input: {e}", flush=True)
+sys.excepthook = _excepthook
 
+def main():
+    # Read input from stdin
+    input_data = sys.stdin.buffer.read()
+    if not input_data:
+        print("No input JSON provided")
 
-    except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+    # Parse input JSON
+    try:
+        data = json.loads(input_data)
+        monitor_match = data['monitor_match']
+        args = data['args']
+        if args:
+            print(f"Args: {args}")
+    except json.JSONDecodeError as e:
+        print(f"Invalid JSON input: {e}")
 
 if __name__ == "__main__":
     main()
@@ -1,35 +1,53 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -I -S
 import sys
-import json
-import logging
+try:
+    import orjson as json
+except ImportError:
+    import json
 
-def main():
-    try:
-        # Read input from stdin
-        input_data = sys.stdin.read()
-        if not input_data:
-            print("No input JSON provided", flush=True)
-            return False
+VERBOSE = '--verbose'
+_OUT = (b'false\n', b'true\n')
 
-        # Parse input JSON
-        try:
-            data = json.loads(input_data)
-            args = data['args']
-        except json.JSONDecodeError as e:
-            print(f"Invalid JSON input: {e}", flush=True)
-            return False
+def _excepthook(exc_type, exc, tb):
+    # Surface unexpected errors on stderr and exit non-zero so the monitor
+    # logs a script failure instead of parsing a stale verdict
+    sys.stderr.write(f"Error: {exc}\n")
+    sys.exit(2)
 
-        # Check if --verbose is in args
-        result = '--verbose' in args
-        print(f"Verbose mode is {'enabled' if result else 'disabled'}", flush=True)
-        logging.info(f"Verbose mode is {'enabled' if result else 'disabled'}")
-        return result
+sys.excepthook = _excepthook
 
-    except Exception as e:
-        print(f"Error processing input: {e}", flush=True)
+def main():
+    # Read input from stdin
+    input_data = sys.stdin.buffer.read()
+    if not input_data:
+        print("No input JSON provided")
         return False
 
+    # Parse input JSON
+    try:
+        data = json.loads(input_data)
+        args = data['args']
+    except json.JSONDecodeError as e:
+        print(f"Invalid JSON input: {e}")
+        return False
+
+    # Check if --verbose is in args (args may be a list or a single
+    # space-separated string)
+    if isinstance(args, (list, tuple, set)):
+        result = VERBOSE in args
+    else:
+        result = VERBOSE in (args or '').split()
+    print(f"Verbose mode is {'enabled' if result else 'disabled'}")
+    return result
+
 if __name__ == "__main__":
     result = main()
-    # Print the final boolean result
-    print(str(result).lower(), flush=True)
+    if "--exit-code" in sys.argv[1:]:
+        # Verdict via exit status (0 enabled, 1 disabled) for callers that
+        # check return codes instead of parsing stdout
+        sys.exit(0 if result else 1)
+    # Write the final boolean result without allocating intermediate strings;
+    # flush the text layer first so diagnostics stay ahead of the verdict
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_OUT[bool(result)])
+    sys.stdout.buffer.flush()